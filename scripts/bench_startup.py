@@ -0,0 +1,108 @@
+"""Benchmark startup time of the offline ``python -m src`` subcommands.
+
+Each subcommand runs in a fresh interpreter against the sample data in
+``tests/raw`` (outputs go to a temporary directory). The child process reports
+its wall time and whether heavy dependencies (``openai``, ``dotenv``) ended up
+in ``sys.modules``. Offline subcommands must not load either of them.
+
+Run:
+  python scripts/bench_startup.py [--repeat 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ("openai", "dotenv")
+
+CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+from src.cli import main
+main(sys.argv[1:])
+elapsed = time.perf_counter() - t0
+print(json.dumps({"elapsed": elapsed,
+                  "loaded": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def _run_child(argv: list) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD, *argv],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _time_import(module: str, repeat: int) -> float:
+    """Median time of ``import <module>`` in a fresh interpreter (NaN if missing)."""
+    code = f"import time; t=time.perf_counter(); import {module}; print(time.perf_counter()-t)"
+    times = []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        if proc.returncode != 0:
+            return float("nan")
+        times.append(float(proc.stdout.strip()))
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = Path(tmp) / "processed"
+        run_dir = Path(tmp) / "run"
+        run_dir.mkdir()
+        answers = PROJECT_ROOT / "tests" / "raw" / "answers.txt"
+        (run_dir / "gold_set_1.txt").write_text(answers.read_text(encoding="utf-8"), encoding="utf-8")
+        (run_dir / "predictions_set_1.txt").write_text(
+            (PROJECT_ROOT / "tests" / "processed" / "prediction_numbered.txt").read_text(encoding="utf-8"),
+            encoding="utf-8",
+        )
+
+        csv_file = Path(tmp) / "test_case.csv"
+        csv_file.write_text(
+            'user_prompt,output\n"질문 하나","사실형,긍정,과거,확실"\n', encoding="utf-8"
+        )
+
+        commands = {
+            "prepare": ["prepare", "--input", str(csv_file),
+                        "--question-out", str(Path(tmp) / "prepared" / "questions.txt"),
+                        "--answer-out", str(Path(tmp) / "prepared" / "answers.txt")],
+            "score": ["score", "--out-dir", str(out_dir)],
+            "rescore": ["rescore", str(run_dir)],
+            "report": ["report", "--gold", str(answers),
+                       "--pred", str(out_dir / "prediction_numbered.txt"),
+                       "--output", str(out_dir / "report.txt")],
+        }
+
+        failed = False
+        print(f"{'command':<10}{'median ms':>12}{'max ms':>10}  heavy modules loaded")
+        for name, argv in commands.items():
+            samples = [_run_child(argv) for _ in range(args.repeat)]
+            elapsed = [s["elapsed"] * 1000 for s in samples]
+            loaded = sorted({m for s in samples for m in s["loaded"]})
+            failed = failed or bool(loaded)
+            print(f"{name:<10}{statistics.median(elapsed):>12.1f}{max(elapsed):>10.1f}  {', '.join(loaded) or '-'}")
+
+    for module in HEAVY_MODULES:
+        ms = _time_import(module, min(args.repeat, 5)) * 1000
+        label = "not installed" if ms != ms else f"{ms:.1f} ms"
+        print(f"(reference) import {module}: {label}")
+
+    if failed:
+        raise SystemExit("offline subcommands loaded heavy dependencies")
+
+
+if __name__ == "__main__":
+    main()
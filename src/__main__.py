@@ -0,0 +1,5 @@
+"""`python -m src` 진입점"""
+
+from .cli import main
+
+main()
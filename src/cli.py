@@ -0,0 +1,169 @@
+"""
+`python -m src` 통합 명령줄 인터페이스
+
+하위 명령:
+- prepare : 원본 CSV → 질문/정답 텍스트 (오프라인)
+- run     : 무작위 테스트 세트에 대해 GPT 분류 및 평가 (OpenAI API 호출)
+- score   : 로컬 예측에 질문 번호를 붙이고 채점 (오프라인)
+- rescore : 기존 실행 폴더(data/results/<타임스탬프>)를 다시 채점 (오프라인)
+- report  : 번호가 매겨진 정답/예측 파일을 채점해 리포트 출력 (오프라인)
+
+시작 시간을 줄이기 위해 이 모듈은 표준 라이브러리만 불러온다.
+`openai`, `dotenv` 등 무거운 의존성은 그것이 필요한 하위 명령(run) 안에서만 import 한다.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+
+def _load_system_prompt(path: str) -> str:
+    """Read the system prompt from ``path`` if it exists."""
+    p = Path(path)
+    if not p.exists():
+        return ""
+    return p.read_text(encoding="utf-8").strip()
+
+
+def _cmd_prepare(args: argparse.Namespace) -> None:
+    from .prepare import make_question_answer_files
+
+    answer_out = make_question_answer_files(
+        Path(args.input), Path(args.question_out), Path(args.answer_out)
+    )
+    print(f"Saved questions to: {args.question_out}")
+    if answer_out:
+        print(f"Saved answers to: {answer_out}")
+
+
+def _cmd_run(args: argparse.Namespace) -> None:
+    from .config import Config
+    from .gpt_client import GPTClient
+    from .evaluator import ResponseEvaluator
+
+    cfg = Config(args.config)
+    system_prompt = args.system_prompt or _load_system_prompt(args.system_prompt_file)
+
+    client = GPTClient(cfg.get_api_key())
+    evaluator = ResponseEvaluator(client)
+
+    client.run_test_sets(
+        question_file=args.question_file,
+        set_size=args.set_size,
+        set_count=args.set_count,
+        output_dir=args.output_dir,
+        system_prompt=system_prompt,
+        answer_file=args.answer_file,
+        evaluator=evaluator,
+    )
+
+
+def _cmd_score(args: argparse.Namespace) -> None:
+    from .scoring import prepare_and_score
+
+    out_dir = Path(args.out_dir)
+    out_pred = out_dir / "prediction_numbered.txt"
+    out_report = out_dir / "score_report.txt"
+    try:
+        prepare_and_score(
+            Path(args.questions),
+            Path(args.predictions),
+            Path(args.answers),
+            out_pred,
+            out_report,
+            max_wrong=args.max_wrong,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        raise SystemExit(str(e))
+
+    print(f"Saved numbered predictions to: {out_pred}")
+    print(f"Saved evaluation report to: {out_report}")
+
+
+def _cmd_rescore(args: argparse.Namespace) -> None:
+    from .scoring import rescore_run_dir
+
+    try:
+        results_list = rescore_run_dir(Path(args.run_dir))
+    except (FileNotFoundError, ValueError) as e:
+        raise SystemExit(str(e))
+
+    scored = [n for n, res in results_list if "error" not in res]
+    skipped = [n for n, res in results_list if "error" in res]
+    print(f"Rescored {len(scored)} set(s) in: {args.run_dir}")
+    if skipped:
+        print(f"Skipped set(s) with no common IDs: {', '.join(map(str, skipped))}")
+    if not scored:
+        raise SystemExit("채점할 수 있는 세트가 없습니다.")
+
+
+def _cmd_report(args: argparse.Namespace) -> None:
+    from .scoring import format_report, score_files
+
+    for p in (args.gold, args.pred):
+        if not Path(p).exists():
+            raise SystemExit(f"파일 없음: {p}")
+
+    report = "\n".join(format_report(score_files(Path(args.gold), Path(args.pred)), args.max_wrong))
+    if args.output:
+        Path(args.output).write_text(report, encoding="utf-8")
+        print(f"Saved evaluation report to: {args.output}")
+    else:
+        print(report)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="GPT response evaluator command line interface.",
+    )
+    sub = parser.add_subparsers(dest="command", metavar="command")
+    sub.required = True
+
+    p = sub.add_parser("prepare", help="Convert the raw CSV into question/answer files.")
+    p.add_argument("--input", default="data/raw/test_case.csv")
+    p.add_argument("--question-out", default="data/processed/test_questions.txt")
+    p.add_argument("--answer-out", default="data/processed/test_answers.txt")
+    p.set_defaults(func=_cmd_prepare)
+
+    p = sub.add_parser("run", help="Run GPT classification on random test sets.")
+    p.add_argument("--question-file", default="data/processed/test_questions.txt")
+    p.add_argument("--set-size", type=int, default=300)
+    p.add_argument("--set-count", type=int, default=3)
+    p.add_argument("--output-dir", default="data/results")
+    p.add_argument("--system-prompt", default=None)
+    p.add_argument("--system-prompt-file", default="config/system_prompt.txt")
+    p.add_argument("--answer-file", default="data/processed/test_answers.txt")
+    p.add_argument("--config", default="config/config.json")
+    p.set_defaults(func=_cmd_run)
+
+    p = sub.add_parser("score", help="Number local predictions and score them (offline).")
+    p.add_argument("--questions", default="tests/raw/questions.txt")
+    p.add_argument("--predictions", default="tests/raw/prediction.txt")
+    p.add_argument("--answers", default="tests/raw/answers.txt")
+    p.add_argument("--out-dir", default="tests/processed")
+    p.add_argument("--max-wrong", type=int, default=10)
+    p.set_defaults(func=_cmd_score)
+
+    p = sub.add_parser("rescore", help="Re-score a saved run directory (offline).")
+    p.add_argument("run_dir", help="e.g. data/results/20250101_120000_000000")
+    p.set_defaults(func=_cmd_rescore)
+
+    p = sub.add_parser("report", help="Score numbered gold/prediction files and print a report (offline).")
+    p.add_argument("--gold", required=True)
+    p.add_argument("--pred", required=True)
+    p.add_argument("--output", default=None)
+    p.add_argument("--max-wrong", type=int, default=None)
+    p.set_defaults(func=_cmd_report)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -3,13 +3,15 @@
 """
 import re
 from datetime import datetime
-from typing import Dict, Any, List, Set, Tuple
-from .gpt_client import GPTClient
+from typing import Dict, Any, List, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .gpt_client import GPTClient
 
 class ResponseEvaluator:
     ATTRS = ["유형", "극성", "시제", "확실성"]
 
-    def __init__(self, gpt_client: GPTClient):
+    def __init__(self, gpt_client: "GPTClient"):
         self.gpt_client = gpt_client
 
     def evaluate_response(self, question: str, response: str, criteria: Dict[str, Any]) -> Dict[str, Any]:
@@ -156,6 +158,53 @@ class ResponseEvaluator:
         with open(output_file, "w", encoding="utf-8") as f:
             f.write("\n".join(lines))
 
+    def save_summary(self, results_list: List[Tuple[int, Dict[str, Any]]], output_file: str) -> List[int]:
+        """
+        (세트 번호, 평가 결과) 목록을 세트별/전체 합산 요약 파일로 저장.
+        채점할 수 없는("error") 세트는 합산에서 제외하고 번호를 기록하며, 그 번호 목록을 반환
+        """
+        scored = [(n, res) for n, res in results_list if "error" not in res]
+        skipped = [n for n, res in results_list if "error" in res]
+
+        with open(output_file, "w", encoding="utf-8") as f:
+            for n, res in scored:
+                f.write(f"===== 세트 {n} =====\n")
+                f.write(f"샘플 수: {res['total_samples']}\n")
+                for attr in self.ATTRS:
+                    f.write(f"{attr}: {res['slot_accuracy'][attr]:.4f}\n")
+                f.write(
+                    f"전체 평균 점수(4속성 평균): {res['overall_average']:.4f}\n"
+                )
+                f.write(f"(참고) exact match: {res['exact_match']:.4f}\n")
+                f.write("\n")
+
+            if skipped:
+                f.write(f"채점 불가 세트(공통 번호 없음): {', '.join(map(str, skipped))}\n\n")
+
+            total_samples = sum(r["total_samples"] for _, r in scored)
+            slot_totals = {attr: 0.0 for attr in self.ATTRS}
+            exact_total = 0.0
+            for _, r in scored:
+                exact_total += r["exact_match"] * r["total_samples"]
+                for attr in self.ATTRS:
+                    slot_totals[attr] += r["slot_accuracy"][attr] * r["total_samples"]
+
+            if total_samples:
+                f.write("===== 전체 합산 =====\n")
+                slot_avgs = {
+                    attr: slot_totals[attr] / total_samples for attr in self.ATTRS
+                }
+                for attr, acc in slot_avgs.items():
+                    f.write(f"{attr}: {acc:.4f}\n")
+                overall_avg = sum(slot_avgs.values()) / len(slot_avgs)
+                exact_avg = exact_total / total_samples
+                f.write(
+                    f"전체 평균 점수(4속성 평균): {overall_avg:.4f}\n"
+                )
+                f.write(f"(참고) exact match: {exact_avg:.4f}\n")
+
+        return skipped
+
     def _create_evaluation_prompt(self, question: str, response: str, criteria: Dict[str, Any]) -> str:
         """
         평가를 위한 프롬프트 생성
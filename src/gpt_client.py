@@ -160,53 +160,8 @@ class GPTClient:
                 result = evaluator.evaluate_from_files(
                     str(gold_file), str(pred_file), str(report_file)
                 )
-                results_list.append(result)
+                results_list.append((i + 1, result))
 
         if results_list:
             summary_file = run_dir / "score_report_summary.txt"
-            with summary_file.open("w", encoding="utf-8") as f:
-                wrong_all = []
-                for idx, res in enumerate(results_list, 1):
-                    f.write(f"===== 세트 {idx} =====\n")
-                    f.write(f"샘플 수: {res['total_samples']}\n")
-                    for attr in evaluator.ATTRS:
-                        f.write(f"{attr}: {res['slot_accuracy'][attr]:.4f}\n")
-                    f.write(
-                        f"전체 평균 점수(4속성 평균): {res['overall_average']:.4f}\n"
-                    )
-                    f.write(f"(참고) exact match: {res['exact_match']:.4f}\n")
-                    wrong_samples = res.get("wrong_samples")
-                    # if wrong_samples:
-                    #     f.write("----- 오답 상세 -----\n")
-                    #     for qid, g, p in wrong_samples:
-                    #         f.write(f"{qid}. 정답: {g} | 예측: {p}\n")
-                    #         wrong_all.append((idx, qid, g, p))
-                    f.write("\n")
-
-                total_samples = sum(r["total_samples"] for r in results_list)
-                slot_totals = {attr: 0.0 for attr in evaluator.ATTRS}
-                exact_total = 0.0
-                for r in results_list:
-                    exact_total += r["exact_match"] * r["total_samples"]
-                    for attr in evaluator.ATTRS:
-                        slot_totals[attr] += r["slot_accuracy"][attr] * r["total_samples"]
-
-                if total_samples:
-                    f.write("===== 전체 합산 =====\n")
-                    slot_avgs = {
-                        attr: slot_totals[attr] / total_samples for attr in evaluator.ATTRS
-                    }
-                    for attr, acc in slot_avgs.items():
-                        f.write(f"{attr}: {acc:.4f}\n")
-                    overall_avg = sum(slot_avgs.values()) / len(slot_avgs)
-                    exact_avg = exact_total / total_samples
-                    f.write(
-                        f"전체 평균 점수(4속성 평균): {overall_avg:.4f}\n"
-                    )
-                    f.write(f"(참고) exact match: {exact_avg:.4f}\n")
-
-                # if wrong_all:
-                #     f.write("\n===== 전체 오답 모음 =====\n")
-                #     for set_idx, qid, g, p in wrong_all:
-                #         f.write(f"[세트 {set_idx}] {qid}. 정답: {g} | 예측: {p}\n")
-
+            evaluator.save_summary(results_list, str(summary_file))
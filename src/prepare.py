@@ -0,0 +1,51 @@
+"""원본 CSV를 질문/정답 텍스트 파일로 변환하는 전처리 모듈"""
+
+import csv
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+def read_rows(path: Path) -> List[Dict[str, str]]:
+    """여러 인코딩을 차례로 시도하여 CSV 행을 읽는다."""
+    for enc in ("utf-8-sig", "utf-8", "cp949", "euc-kr"):
+        try:
+            with open(path, encoding=enc, newline="") as f:
+                return list(csv.DictReader(f))
+        except Exception:
+            pass
+    raise RuntimeError("CSV 읽기 실패")
+
+
+def make_question_answer_files(
+    input_file: Path, question_out: Path, answer_out: Path
+) -> Optional[Path]:
+    """
+    CSV의 `user_prompt`/`output` 열을 '번호. 내용' 형식의 텍스트로 저장.
+    정답 파일을 만들었으면 그 경로를, 라벨 열이 없으면 None을 반환
+    """
+    question_out = Path(question_out)
+    answer_out = Path(answer_out)
+    # 디렉토리가 없으면 생성
+    question_out.parent.mkdir(parents=True, exist_ok=True)
+
+    rows = read_rows(input_file)
+    headers = rows[0].keys()
+
+    text_col = "user_prompt" if "user_prompt" in headers else next(iter(headers))
+    labels_col = "output" if "output" in headers else None
+
+    with open(question_out, "w", encoding="utf-8") as fq:
+        for i, r in enumerate(rows, 1):
+            fq.write(f"{i}.{(r.get(text_col, '') or '').strip()}\n")
+
+    if not labels_col:
+        return None
+
+    answer_out.parent.mkdir(parents=True, exist_ok=True)
+    with open(answer_out, "w", encoding="utf-8") as fa:
+        for i, r in enumerate(rows, 1):
+            lab = (r.get(labels_col, "") or "").strip().strip('"').strip("'")
+            lab = re.sub(r"\s+", "", lab)
+            fa.write(f"{i}. {lab}\n")
+    return answer_out
@@ -0,0 +1,160 @@
+"""
+GPT 호출 없이 저장된 예측 파일을 채점하는 오프라인 모듈
+
+OpenAI SDK를 불러오지 않도록 `ResponseEvaluator`만 사용한다.
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .evaluator import ResponseEvaluator
+
+ID_PATTERN = re.compile(r"^(\d+)\.")
+SET_PATTERN = re.compile(r"^gold_set_(\d+)\.txt$")
+
+
+def read_nonempty_lines(p: Path) -> List[str]:
+    return [ln.strip() for ln in Path(p).read_text(encoding="utf-8").splitlines() if ln.strip()]
+
+
+def extract_ids(lines: List[str]) -> List[str]:
+    ids: List[str] = []
+    for s in lines:
+        m = ID_PATTERN.match(s)
+        if m:
+            ids.append(m.group(1))
+    return ids
+
+
+def number_predictions(q_ids: List[str], preds: List[str]) -> List[str]:
+    n = min(len(q_ids), len(preds))
+    return [f"{q_ids[i]}. {preds[i]}" for i in range(n)]
+
+
+def format_report(results: Dict[str, Any], max_wrong: Optional[int] = None) -> List[str]:
+    """
+    채점 결과를 리포트 줄 목록으로 변환. `max_wrong`이 주어지면 오답 예시 수를 제한
+    """
+    if "error" in results:
+        return [
+            "===== 채점 결과 =====",
+            results["error"],
+            f"정답만 존재: {results.get('gold_only', [])} | 예측만 존재: {results.get('pred_only', [])}",
+        ]
+
+    report_lines = [
+        "===== 채점 결과 =====",
+        f"시각: {results['timestamp']}",
+        f"샘플 수(교집합): {results['total_samples']}",
+        f"정답만 존재: {results['gold_only']} | 예측만 존재: {results['pred_only']}",
+    ]
+    for attr, acc in results["slot_accuracy"].items():
+        report_lines.append(f"{attr}: {acc:.4f}")
+    report_lines.extend([
+        f"전체 평균 점수(4속성 평균): {results['overall_average']:.4f}",
+        f"(참고) exact match: {results['exact_match']:.4f}",
+        f"오답 수: {results['wrong_count']}",
+    ])
+
+    wrong_samples = results.get("wrong_samples") or []
+    if wrong_samples:
+        if max_wrong is None:
+            report_lines.append("===== 오답 상세 =====")
+            shown = wrong_samples
+        else:
+            shown = wrong_samples[:max_wrong]
+            report_lines.append(f"===== 오답 상세 (예시 {len(shown)}개) =====")
+        for idx, g, p in shown:
+            report_lines.append(f"{idx}. 정답: {g} | 예측: {p}")
+        if len(shown) < len(wrong_samples):
+            report_lines.append(
+                f"... (총 {results['wrong_count']}개 중 {max_wrong}개 표시)"
+            )
+    return report_lines
+
+
+def score_files(gold_file: Path, pred_file: Path) -> Dict[str, Any]:
+    """번호가 매겨진 정답/예측 파일을 채점 (리포트 파일은 저장하지 않음)"""
+    evaluator = ResponseEvaluator(gpt_client=None)  # type: ignore[arg-type]
+    return evaluator.evaluate_from_files(str(gold_file), str(pred_file), None)
+
+
+def prepare_and_score(
+    questions: Path,
+    predictions: Path,
+    answers: Path,
+    out_pred: Path,
+    out_report: Path,
+    max_wrong: Optional[int] = 10,
+) -> Dict[str, Any]:
+    """
+    질문 파일의 번호를 예측 각 줄에 순서대로 붙인 뒤 정답과 비교하여 채점
+    """
+    # Validate inputs
+    for p in (questions, predictions, answers):
+        if not Path(p).exists():
+            raise FileNotFoundError(f"파일 없음: {p}")
+
+    q_lines = read_nonempty_lines(questions)
+    p_lines = read_nonempty_lines(predictions)
+    ids = extract_ids(q_lines)
+    if not ids:
+        raise ValueError(
+            f"{questions}에서 유효한 번호를 찾지 못했습니다. '12345. ...' 형식 필요"
+        )
+
+    out_pred = Path(out_pred)
+    out_report = Path(out_report)
+    out_pred.parent.mkdir(parents=True, exist_ok=True)
+    out_report.parent.mkdir(parents=True, exist_ok=True)
+
+    numbered = number_predictions(ids, p_lines)
+    out_pred.write_text("\n".join(numbered) + "\n", encoding="utf-8")
+
+    results = score_files(answers, out_pred)
+    out_report.write_text("\n".join(format_report(results, max_wrong)), encoding="utf-8")
+    return results
+
+
+def _find_sets(run_dir: Path) -> List[Tuple[int, Path, Path]]:
+    sets = []
+    for gold_file in run_dir.iterdir():
+        mo = SET_PATTERN.match(gold_file.name)
+        if not mo:
+            continue
+        n = int(mo.group(1))
+        pred_file = run_dir / f"predictions_set_{n}.txt"
+        if pred_file.exists():
+            sets.append((n, gold_file, pred_file))
+    return sorted(sets)
+
+
+def rescore_run_dir(run_dir: Path) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    `run_test_sets`가 저장한 실행 폴더의 gold/predictions 세트를 다시 채점하여
+    `score_report_set_N.txt`와 `score_report_summary.txt`를 갱신.
+    채점할 수 없는 세트를 포함해 (세트 번호, 평가 결과) 목록을 반환
+    """
+    run_dir = Path(run_dir)
+    if not run_dir.is_dir():
+        raise FileNotFoundError(f"실행 폴더를 찾을 수 없습니다: {run_dir}")
+
+    sets = _find_sets(run_dir)
+    if not sets:
+        raise ValueError(f"채점할 gold_set_N.txt/predictions_set_N.txt 쌍이 없습니다: {run_dir}")
+
+    evaluator = ResponseEvaluator(gpt_client=None)  # type: ignore[arg-type]
+    results_list = []
+    for n, gold_file, pred_file in sets:
+        report_file = run_dir / f"score_report_set_{n}.txt"
+        result = evaluator.evaluate_from_files(
+            str(gold_file), str(pred_file), str(report_file)
+        )
+        if "error" in result:
+            report_file.write_text("\n".join(format_report(result)), encoding="utf-8")
+        results_list.append((n, result))
+
+    # 모든 세트가 채점 불가여도 이전 실행의 요약이 남지 않도록 항상 덮어쓴다
+    evaluator.save_summary(results_list, str(run_dir / "score_report_summary.txt"))
+    return results_list